@@ -1,214 +1,119 @@
-import streamlit as st
-import base64
-
-def get_base64_video(video_path):
-    """Get base64 encoded video."""
-    try:
-        with open(video_path, "rb") as video_file:
-            return base64.b64encode(video_file.read()).decode()
-    except FileNotFoundError:
-        st.error(f"Video file {video_path} not found")
-        return ""
+DEPLOYMENT_LINKS = {
+    "IF": "https://bioinformatics-if-prediction.streamlit.app",
+    "Args": "https://args-classifier.streamlit.app",
+    "PPIN": "https://bioinformatics-ppin.streamlit.app",
+    "Similarity": "https://bioinformatics-similarity.streamlit.app"
+}
 
 def get_app_link(app_name):
-    """Dynamically generate links for different apps."""
-    deployment_links = {
-        "IF": "https://bioinformatics-if-prediction.streamlit.app",
-        "Args": "https://args-classifier.streamlit.app", 
-        "PPIN": "https://bioinformatics-ppin.streamlit.app",
-        "Similarity": "https://bioinformatics-similarity.streamlit.app"
-    }
-    return deployment_links.get(app_name, "#")
+    """Look up the deployment link for an app."""
+    return DEPLOYMENT_LINKS.get(app_name, "#")
 
-st.set_page_config(
-    layout="wide",
-    page_title="Interactive Dashboard",
-    page_icon="🎥",
-    initial_sidebar_state="collapsed"
+# Minified stylesheet; each rule starts on a new literal to keep diffs readable
+_CSS_STATIC = (
+    "<style>"
+    "#MainMenu,footer,header{visibility:hidden}"
+    "body{margin:0;overflow-x:hidden}"
+    ".video-container{position:fixed;right:0;bottom:0;min-width:100%;min-height:100%;"
+    "width:100%;height:100%;z-index:-1;overflow:hidden;background:rgba(0,0,0,.3)}"
+    "#background-video{position:absolute;top:50%;left:50%;transform:translate(-50%,-50%) scale(1);"
+    "min-width:100%;min-height:100%;width:auto;height:auto;object-fit:cover}"
+    ".stApp{background:none}"
+    ".card-link{text-decoration:none}"
+    ".card{background-color:rgba(226,247,250,.9);border-radius:20px;padding:1.5rem;margin:3rem;"
+    "text-align:center;box-shadow:0 4px 6px rgba(0,0,2,.1);width:500px;height:200px;"
+    "transition:transform .3s ease,box-shadow .3s ease;cursor:pointer;display:flex;"
+    "flex-direction:column;justify-content:center}"
+    ".card:hover{transform:translateY(-5px);box-shadow:0 6px 12px rgba(0,0,0,.15)}"
+    ".card h3{margin-bottom:1rem;color:#1f1f1f}"
+    ".card p{color:#666;font-size:.9rem}"
+    "@media (max-width:768px){.card{width:100%;margin:1rem 0}}"
+    "</style>"
 )
 
-def load_css(video_base64):
-    """Generate CSS for styling the application."""
-    return f"""
-        <style>
-            body {{
-                margin: 0;
-                overflow-x: hidden;
-            }}
-            
-            .video-container {{
-                position: fixed;
-                right: 0;
-                bottom: 0;
-                min-width: 100%;
-                min-height: 100%;
-                width: 100%;
-                height: 100%;
-                z-index: -1;
-                overflow: hidden;
-                background: rgba(0, 0, 0, 0.3);
-            }}
+_VIDEO_HTML = (
+    '<div class="video-container">'
+    '<video id="background-video" autoplay loop muted playsinline poster="app/static/poster.jpg">'
+    '<source src="app/static/background.webm" type="video/webm">'
+    '<source src="app/static/background.mp4" type="video/mp4">'
+    '</video>'
+    '</div>'
+)
+
+PAGE_HTML = _CSS_STATIC + _VIDEO_HTML
+
+def load_css():
+    """Return the styling and background video markup, built once at import."""
+    return PAGE_HTML
 
-            #background-video {{
-                position: absolute;
-                top: 50%;
-                left: 50%;
-                transform: translate(-50%, -50%) scale(1.00);
-                min-width: 100%;
-                min-height: 100%;
-                width: auto;
-                height: auto;
-                object-fit: cover;
-            }}
-            
-            .stApp {{
-                background: none;
-            }}
-            
-            .card {{
-                background-color: rgba(226, 247, 250, 0.9);
-                border-radius: 20px;
-                padding: 1.5rem;
-                margin: 3rem;
-                text-align: center;
-                box-shadow: 0 4px 6px rgba(0, 0, 2, 0.1);
-                width: 500px;
-                height: 200px;
-                transition: transform 0.3s ease, box-shadow 0.3s ease;
-                cursor: pointer;
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-            }}
-            
-            .card:hover {{
-                transform: translateY(-5px);
-                box-shadow: 0 6px 12px rgba(0, 0, 0, 0.15);
-            }}
-            
-            .card h3 {{
-                margin-bottom: 1rem;
-                color: #1f1f1f;
-            }}
-            
-            .card p {{
-                color: #666;
-                font-size: 0.9rem;
-            }}
-            
-            .stButton>button {{
-                background-color: rgba(226, 247, 250, 0.9);
-                border-radius: 20px;
-                padding: 1.5rem;
-                margin: 3rem;
-                text-align: center;
-                box-shadow: 0 4px 6px rgba(0, 0, 2, 0.1);
-                width: 500px;
-                height: 200px;
-                transition: transform 0.3s ease, box-shadow 0.3s ease;
-                display: flex;
-                flex-direction: column;
-                justify-content: center;
-                border: none;
-                color: #1f1f1f;
-            }}
-            
-            .stButton>button:hover {{
-                transform: translateY(-5px);
-                box-shadow: 0 6px 12px rgba(0, 0, 0, 0.15);
-                background-color: rgba(226, 247, 250, 0.9);
-            }}
-            
-            @media (max-width: 768px) {{
-                .card, .stButton>button {{
-                    width: 100%;
-                    margin: 1rem 0;
-                }}
-            }}
-        </style>
-        <div class="video-container">
-            <video id="background-video" autoplay loop muted playsinline>
-                <source src="data:video/mp4;base64,{video_base64}" type="video/mp4">
-            </video>
-        </div>
+# Define apps with details
+APPS = [
+    {
+        "name": "(IF)",
+        "description": "🧬 Imprinting Factor (IF) Prediction",
+        "link": get_app_link("IF"),
+        "icon": "🔬"
+    },
+    {
+        "name": "Args",
+        "description": "ARG Classifier & Mobility Analyzer", 
+        "link": get_app_link("Args"),
+        "icon": "🧪"
+    },
+    {
+        "name": "PPIN",
+        "description": "Protein-Protein Interaction Network Analysis",
+        "link": get_app_link("PPIN"),
+        "icon": "🌐"
+    },
+    {
+        "name": "Similarity",
+        "description": "Explore Similarity Metrics",
+        "link": get_app_link("Similarity"),
+        "icon": "🔗"
+    }
+]
+
+def create_card(app):
+    """Render an app as a clickable card linking to its deployment."""
+    return f"""
+        <a class="card-link" href="{app['link']}" target="_self">
+            <div class="card">
+                <h3>{app['icon']} {app['name']}</h3>
+                <p>{app['description']}</p>
+            </div>
+        </a>
     """
 
+# Cards never change, so render each column's markup once
+COLUMN_HTML = (
+    "".join(create_card(app) for app in APPS[:2]),
+    "".join(create_card(app) for app in APPS[2:]),
+)
+
 def main():
-    # Hide default Streamlit elements
-    st.markdown("""
-        <style>
-            #MainMenu {visibility: hidden;}
-            footer {visibility: hidden;}
-            header {visibility: hidden;}
-        </style>
-    """, unsafe_allow_html=True)
+    # Imported here so the page data above can be used without Streamlit
+    import streamlit as st
 
-    # Video background
-    video_path = "background.mp4"
-    try:
-        video_base64 = get_base64_video(video_path)
-        st.markdown(load_css(video_base64), unsafe_allow_html=True)
-    except Exception as e:
-        st.warning(f"Background video loading error: {e}")
+    st.set_page_config(
+        layout="wide",
+        page_title="Interactive Dashboard",
+        page_icon="🎥",
+        initial_sidebar_state="collapsed"
+    )
 
-    # Define apps with details
-    apps = [
-        {
-            "name": "(IF)",
-            "description": "🧬 Imprinting Factor (IF) Prediction",
-            "link": get_app_link("IF"),
-            "icon": "🔬"
-        },
-        {
-            "name": "Args",
-            "description": "ARG Classifier & Mobility Analyzer", 
-            "link": get_app_link("Args"),
-            "icon": "🧪"
-        },
-        {
-            "name": "PPIN",
-            "description": "Protein-Protein Interaction Network Analysis",
-            "link": get_app_link("PPIN"),
-            "icon": "🌐"
-        },
-        {
-            "name": "Similarity",
-            "description": "Explore Similarity Metrics",
-            "link": get_app_link("Similarity"),
-            "icon": "🔗"
-        }
-    ]
+    # Page styling, hidden Streamlit chrome and video background in one element
+    st.markdown(load_css(), unsafe_allow_html=True)
 
     # Create columns
     col1, col2 = st.columns(2)
 
     # Render apps in columns
     with col1:
-        for app in apps[:2]:
-            if st.button(f"{app['icon']} {app['name']}\n\n{app['description']}", key=app['name'], use_container_width=True):
-                st.markdown(f'<meta http-equiv="refresh" content="0;url={app["link"]}">', unsafe_allow_html=True)
+        st.markdown(COLUMN_HTML[0], unsafe_allow_html=True)
 
     with col2:
-        for app in apps[2:]:
-            if st.button(f"{app['icon']} {app['name']}\n\n{app['description']}", key=app['name'], use_container_width=True):
-                st.markdown(f'<meta http-equiv="refresh" content="0;url={app["link"]}">', unsafe_allow_html=True)
-
-    # Add custom JavaScript for additional link handling
-    st.components.v1.html("""
-        <script>
-        document.addEventListener('DOMContentLoaded', (event) => {
-            var buttons = document.querySelectorAll('button');
-            buttons.forEach(function(button) {
-                button.addEventListener('click', function() {
-                    var link = this.getAttribute('data-link');
-                    if (link) {
-                        window.location.href = link;
-                    }
-                });
-            });
-        });
-        </script>
-    """, height=0)
+        st.markdown(COLUMN_HTML[1], unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()